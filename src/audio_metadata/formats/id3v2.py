@@ -1,6 +1,9 @@
 __all__ = [
 	'ID3v2',
 	'ID3v2Flags',
+	'ID3v22Frames',
+	'ID3v23Frames',
+	'ID3v24Frames',
 	'ID3v2Frames',
 	'ID3v2Header'
 ]
@@ -8,7 +11,6 @@ __all__ = [
 import struct
 from collections import defaultdict
 
-import bitstruct
 from attr import attrib, attrs
 from bidict import frozenbidict
 
@@ -17,12 +19,105 @@ from .models import Tags
 from .tables import ID3Version
 from ..exceptions import InvalidFrame, InvalidHeader
 from ..structures import DictMixin
-from ..utils import datareader, decode_synchsafe_int
+from ..utils import datareader
+
+_ID3V2_HEADER = struct.Struct('BBs4s')
+_ID3V22_FRAME_HEADER = struct.Struct('3s3B')
+_ID3V23_FRAME_HEADER = struct.Struct('4s4B2B')
 
 
-# Mappings used: https://picard.musicbrainz.org/docs/mappings/
 class ID3v2Frames(Tags):
-	_v22_FIELD_MAP = frozenbidict(
+	@classmethod
+	def load(cls, data, id3_version):
+		if id3_version is ID3Version.v22:
+			frame_header = _ID3V22_FRAME_HEADER
+			size_len = 3
+			per_byte = 8
+		elif id3_version is ID3Version.v23:
+			frame_header = _ID3V23_FRAME_HEADER
+			size_len = 4
+			per_byte = 8
+		elif id3_version is ID3Version.v24:
+			frame_header = _ID3V23_FRAME_HEADER
+			size_len = 4
+			per_byte = 7
+		else:
+			raise ValueError(f"Unsupported ID3 version: {id3_version}")
+
+		# Frames are parsed by offset directly from the tag bytes,
+		# so the caller bounds the read rather than passing a stream.
+		if not isinstance(data, (bytes, bytearray)):
+			try:
+				data = bytes(memoryview(data))
+			except TypeError:
+				raise ValueError("Not a valid bytes-like object.")
+
+		offset = 0
+
+		frames = defaultdict(list)
+		while True:
+			try:
+				frame, offset = ID3v2Frame.load(data, offset, frame_header, size_len, per_byte)
+			except InvalidFrame:
+				break
+
+			# Ignore oddities/bad frames.
+			if not isinstance(frame, ID3v2BaseFrame):
+				continue
+
+			# TODO: Finish any missing frame types.
+			# TODO: Move representation into frame classes?
+			if isinstance(
+				frame,
+				(
+					ID3v2CommentFrame,
+					ID3v2SynchronizedLyricsFrame,
+					ID3v2UnsynchronizedLyricsFrame
+				)
+			):
+				frames[f'{frame.id}:{frame.description}:{frame.language}'].append(frame.value)
+			elif isinstance(frame, ID3v2GenreFrame):
+				frames['TCON'] = frame.value
+			elif isinstance(frame, ID3v2GEOBFrame):
+				frames[f'GEOB:{frame.description}'].append(
+					{
+
+						'filename': frame.filename,
+						'mime_type': frame.mime_type,
+						'value': frame.value
+					}
+				)
+			elif isinstance(frame, ID3v2PrivateFrame):
+				frames[f'PRIV:{frame.owner}'].append(frame.value)
+			elif isinstance(
+				frame,
+				(
+					ID3v2UserTextFrame,
+					ID3v2UserURLLinkFrame
+				)
+			):
+				frames[f'{frame.id}:{frame.description}'].append(frame.value)
+			elif isinstance(
+				frame,
+				(
+					ID3v2NumericTextFrame,
+					ID3v2TextFrame,
+					ID3v2TimestampFrame
+				)
+			):
+				frames[frame.id] = frame.value
+			else:
+				frames[frame.id].append(frame.value)
+
+		self = _ID3V2_FRAMES_TYPES[id3_version]()
+		self.update(frames)
+
+		return self
+
+
+# Mappings used: https://picard.musicbrainz.org/docs/mappings/
+class ID3v22Frames(ID3v2Frames):
+	FIELD_MAP = frozenbidict(
 		{
 			'album': 'TAL',
 			'albumartist': 'TP2',
@@ -59,8 +154,11 @@ class ID3v2Frames(Tags):
 			'tracknumber': 'TRK'
 		}
 	)
+	_FIELD_MAP_INV = dict(FIELD_MAP.inv)
+
 
-	_v23_FIELD_MAP = frozenbidict(
+class ID3v23Frames(ID3v2Frames):
+	FIELD_MAP = frozenbidict(
 		{
 			'album': 'TALB',
 			'albumsort': 'TSOA',
@@ -103,8 +201,11 @@ class ID3v2Frames(Tags):
 			'tracknumber': 'TRCK'
 		}
 	)
+	_FIELD_MAP_INV = dict(FIELD_MAP.inv)
 
-	_v24_FIELD_MAP = frozenbidict(
+
+class ID3v24Frames(ID3v2Frames):
+	FIELD_MAP = frozenbidict(
 		{
 			'album': 'TALB',
 			'albumsort': 'TSOA',
@@ -148,87 +249,14 @@ class ID3v2Frames(Tags):
 			'tracknumber': 'TRCK'
 		}
 	)
+	_FIELD_MAP_INV = dict(FIELD_MAP.inv)
 
-	@datareader
-	@classmethod
-	def load(cls, data, id3_version):
-		if id3_version is ID3Version.v22:
-			cls.FIELD_MAP = cls._v22_FIELD_MAP
-
-			struct_pattern = '3s3B'
-			size_len = 3
-			per_byte = 8
-		elif id3_version is ID3Version.v23:
-			cls.FIELD_MAP = cls._v23_FIELD_MAP
-
-			struct_pattern = '4s4B2B'
-			size_len = 4
-			per_byte = 8
-		elif id3_version is ID3Version.v24:
-			cls.FIELD_MAP = cls._v24_FIELD_MAP
 
-			struct_pattern = '4s4B2B'
-			size_len = 4
-			per_byte = 7
-		else:
-			raise ValueError(f"Unsupported ID3 version: {id3_version}")
-
-		frames = defaultdict(list)
-		while True:
-			try:
-				frame = ID3v2Frame.load(data, struct_pattern, size_len, per_byte)
-			except InvalidFrame:
-				break
-
-			# Ignore oddities/bad frames.
-			if not isinstance(frame, ID3v2BaseFrame):
-				continue
-
-			# TODO: Finish any missing frame types.
-			# TODO: Move representation into frame classes?
-			if isinstance(
-				frame,
-				(
-					ID3v2CommentFrame,
-					ID3v2SynchronizedLyricsFrame,
-					ID3v2UnsynchronizedLyricsFrame
-				)
-			):
-				frames[f'{frame.id}:{frame.description}:{frame.language}'].append(frame.value)
-			elif isinstance(frame, ID3v2GenreFrame):
-				frames['TCON'] = frame.value
-			elif isinstance(frame, ID3v2GEOBFrame):
-				frames[f'GEOB:{frame.description}'].append(
-					{
-
-						'filename': frame.filename,
-						'mime_type': frame.mime_type,
-						'value': frame.value
-					}
-				)
-			elif isinstance(frame, ID3v2PrivateFrame):
-				frames[f'PRIV:{frame.owner}'].append(frame.value)
-			elif isinstance(
-				frame,
-				(
-					ID3v2UserTextFrame,
-					ID3v2UserURLLinkFrame
-				)
-			):
-				frames[f'{frame.id}:{frame.description}'].append(frame.value)
-			elif isinstance(
-				frame,
-				(
-					ID3v2NumericTextFrame,
-					ID3v2TextFrame,
-					ID3v2TimestampFrame
-				)
-			):
-				frames[frame.id] = frame.value
-			else:
-				frames[frame.id].append(frame.value)
-
-		return cls(frames)
+_ID3V2_FRAMES_TYPES = {
+	ID3Version.v22: ID3v22Frames,
+	ID3Version.v23: ID3v23Frames,
+	ID3Version.v24: ID3v24Frames
+}
 
 
 @attrs(repr=False)
@@ -248,7 +276,7 @@ class ID3v2Header(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if not k.startswith('_'):
 				repr_dict[k] = v
 
@@ -260,26 +288,21 @@ class ID3v2Header(DictMixin):
 		if data.read(3) != b"ID3":
 			raise InvalidHeader("Valid ID3v2 header not found.")
 
-		major, revision, flags_, sync_size = struct.unpack('BBs4s', data.read(7))
+		major, revision, flags_, sync_size = _ID3V2_HEADER.unpack(data.read(7))
 
 		try:
 			version = ID3Version((2, major))
 		except ValueError:
 			raise ValueError(f"Unsupported ID3 version (2.{major}).")
 
-		flags = bitstruct.unpack_dict(
-			'b1 b1 b1 b1',
-			[
-				'unsync',
-				'extended',
-				'experimental',
-				'footer',
-				'ath_type'
-			],
-			flags_
-		)
+		flags = {
+			'unsync': (flags_[0] >> 7) & 1,
+			'extended': (flags_[0] >> 6) & 1,
+			'experimental': (flags_[0] >> 5) & 1,
+			'footer': (flags_[0] >> 4) & 1
+		}
 
-		size = decode_synchsafe_int(sync_size, 7)
+		size = (sync_size[0] << 21) | (sync_size[1] << 14) | (sync_size[2] << 7) | sync_size[3]
 
 		return cls(size, version, flags)
 
@@ -288,7 +311,7 @@ class ID3v2(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if not k.startswith('_'):
 				repr_dict[k] = v
 
@@ -305,26 +328,34 @@ class ID3v2(DictMixin):
 		self._header = ID3v2Header.load(data.read(10))
 		self._size = 10 + self._header._size
 
+		# The tag size includes the extended header but not the footer.
+		frames_size = self._header._size
+
 		if self._header.flags.extended:
-			ext_size = decode_synchsafe_int(
-				struct.unpack('4B', data.read(4))[0:4],
-				7
-			)
-			self._size += ext_size
-
-			if self._header is ID3Version.v24:
-				data.read(ext_size - 4)
+			ext_size_data = data.read(4)
+
+			# ID3v2.4 extended header size is synchsafe and includes the size bytes.
+			if self._header.version is ID3Version.v24:
+				ext_size = (
+					(ext_size_data[0] << 21)
+					| (ext_size_data[1] << 14)
+					| (ext_size_data[2] << 7)
+					| ext_size_data[3]
+				)
 			else:
-				data.read(ext_size)
+				ext_size = int.from_bytes(ext_size_data, byteorder='big') + 4
 
-		if self._header.flags.footer:
-			self._size += 10
-			data.read(10)
+			data.read(ext_size - 4)
+			frames_size -= ext_size
 
 		self.tags = ID3v2Frames.load(
-			data.read(self._header._size),
+			data.read(frames_size),
 			self._header.version
 		)
 		self.pictures = self.tags.pop('pictures', [])
 
+		if self._header.flags.footer:
+			self._size += 10
+			data.read(10)
+
 		return self
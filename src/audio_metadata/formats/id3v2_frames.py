@@ -391,11 +391,10 @@ class ID3v2Frame(ID3v2BaseFrame):
 		'WXXX': ID3v2UserURLLinkFrame
 	}
 
-	@datareader
 	@classmethod
-	def load(cls, data, struct_pattern, size_len, per_byte):
+	def load(cls, data, offset, frame_header, size_len, per_byte):
 		try:
-			frame = struct.unpack(struct_pattern, data.read(struct.calcsize(struct_pattern)))
+			frame = frame_header.unpack_from(data, offset)
 		except struct.error:
 			raise InvalidFrame("Not enough data.")
 
@@ -405,7 +404,10 @@ class ID3v2Frame(ID3v2BaseFrame):
 
 		frame_id = frame[0].decode('iso-8859-1')
 		frame_type = ID3v2Frame._FRAME_TYPES.get(frame_id, cls)
-		frame_data = data.read(frame_size)
+
+		data_start = offset + frame_header.size
+		offset = data_start + frame_size
+		frame_data = data[data_start:offset]
 
 		# TODO: Move logic into frame classes?
 		args = [frame_id]
@@ -419,7 +421,7 @@ class ID3v2Frame(ID3v2BaseFrame):
 
 			# Ignore empty comments.
 			if len(values) < 2:
-				return None
+				return None, offset
 
 			args.extend(values)
 		elif frame_type is ID3v2GenreFrame:
@@ -518,6 +520,6 @@ class ID3v2Frame(ID3v2BaseFrame):
 			args.append(decode_bytestring(frame_data))
 
 		try:
-			return frame_type(*args)
+			return frame_type(*args), offset
 		except (TypeError, ValueError):  # Bad frame value.
-			return None
+			return None, offset
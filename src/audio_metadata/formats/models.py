@@ -21,34 +21,36 @@ from ..utils import (
 
 class Tags(DictMixin):
 	FIELD_MAP = frozenbidict()
+	# Plain dict lookups are much faster than going through a bidict's inverse.
+	_FIELD_MAP_INV = dict(FIELD_MAP.inv)
 
 	def __getitem__(self, key):
-		k = self.FIELD_MAP.get(key, key)
+		k = self.__class__.FIELD_MAP.get(key, key)
 
 		return super().__getitem__(k)
 
 	def __setitem__(self, key, value):
-		k = self.FIELD_MAP.get(key, key)
+		k = self.__class__.FIELD_MAP.get(key, key)
 
 		return super().__setitem__(k, value)
 
 	def __delitem__(self, key):
-		k = self.FIELD_MAP.get(key, key)
+		k = self.__class__.FIELD_MAP.get(key, key)
 
 		return super().__delitem__(k)
 
 	def __iter__(self):
 		return iter(
-			self.FIELD_MAP.inv.get(k, k)
+			self.__class__._FIELD_MAP_INV.get(k, k)
 			for k in self.__dict__
-			if not k.startswith('_') and not k == 'FIELD_MAP'
+			if not k.startswith('_')
 		)
 
 	def __repr__(self, repr_dict=None):
 		repr_dict = {
-			self.FIELD_MAP.inv.get(k, k): v
+			self.__class__._FIELD_MAP_INV.get(k, k): v
 			for k, v in self.__dict__.items()
-			if not k.startswith('_') and not k == 'FIELD_MAP'
+			if not k.startswith('_')
 		}
 
 		return super().__repr__(repr_dict=repr_dict)
@@ -75,7 +77,7 @@ class Format(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if k == 'filesize':
 				repr_dict[k] = humanize_filesize(v, precision=2)
 			elif not k.startswith('_'):
@@ -103,7 +105,7 @@ class Picture(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if k == 'data':
 				repr_dict[k] = humanize_filesize(len(v), precision=2)
 			elif not k.startswith('_'):
@@ -116,7 +118,7 @@ class StreamInfo(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if k == 'bitrate':
 				repr_dict[k] = humanize_bitrate(v)
 			elif k == 'duration':
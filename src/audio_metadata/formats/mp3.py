@@ -14,9 +14,9 @@ __all__ = [
 import os
 import re
 import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-import bitstruct
-import more_itertools
 from attr import attrib, attrs
 
 from .id3v1 import ID3v1
@@ -44,6 +44,50 @@ from ..utils import (
 	humanize_sample_rate
 )
 
+_I8 = struct.Struct('b')
+_I32BE = struct.Struct('>i')
+_U8 = struct.Struct('B')
+_U16BE = struct.Struct('>H')
+_U32BE = struct.Struct('>I')
+_LAME_TAIL = struct.Struct('>I2s2s')
+_VBRI_HEADER = struct.Struct('>HeHIIHHHH')
+
+# MPEG frame header lookups indexed by the raw version_id/layer_index fields.
+_MPEG_VERSIONS = [2.5, None, 2, 1]
+_MPEG_BITRATES = [
+	[MP3Bitrates.get((version, 4 - layer_index)) for layer_index in range(4)]
+	for version in _MPEG_VERSIONS
+]
+_MPEG_SAMPLE_RATES = [MP3SampleRates.get(version) for version in _MPEG_VERSIONS]
+_MPEG_SAMPLES_PER_FRAME = [
+	[MP3SamplesPerFrame.get((version, 4 - layer_index)) for layer_index in range(4)]
+	for version in _MPEG_VERSIONS
+]
+
+# Validity of MPEG frame header bits 10-20 (version_id, layer_index,
+# protection, bitrate_index, sample_rate_index) as a single lookup.
+_VALID_FRAME_HEADER_FIELDS = bytes(
+	(
+		(fields >> 9) & 3 != 1
+		and (fields >> 7) & 3 != 0
+		and (fields >> 2) & 15 not in [0, 15]
+		and fields & 3 != 3
+	)
+	for fields in range(2048)
+)
+
+# Frame sync is 11 set bits: 0xFF followed by a byte with its top 3 bits set.
+_mpeg_sync_re = re.compile(rb'\xFF(?=[\xE0-\xFF])')
+
+_lame_version_re = re.compile(rb'LAME(\d+)\.(\d+)')
+
+
+def _is_valid_frame_header(frame_header):
+	return (
+		frame_header >> 21 == 2047
+		and _VALID_FRAME_HEADER_FIELDS[(frame_header >> 10) & 2047]
+	)
+
 
 @attrs(repr=False)
 class LAMEReplayGain(DictMixin):
@@ -58,33 +102,29 @@ class LAMEReplayGain(DictMixin):
 	@datareader
 	@classmethod
 	def load(cls, data):
-		peak_data = struct.unpack('>I', data.read(4))[0]
+		peak_data = _U32BE.unpack(data.read(4))[0]
 
 		if peak_data == 0:
 			gain_peak = None
 		else:
 			gain_peak = peak_data / 2 ** 23
 
-		track_gain_type_, track_gain_origin_, track_gain_sign, track_gain_adjustment_ = bitstruct.unpack(
-			'u3 u3 b1 u9',
-			data.read(2)
-		)
+		track_gain = int.from_bytes(data.read(2), byteorder='big')
 
-		track_gain_type = LAMEReplayGainType(track_gain_type_)
-		track_gain_origin = LAMEReplayGainOrigin(track_gain_origin_)
-		track_gain_adjustment = track_gain_adjustment_ / 10.0
+		track_gain_type = LAMEReplayGainType((track_gain >> 13) & 7)
+		track_gain_origin = LAMEReplayGainOrigin((track_gain >> 10) & 7)
+		track_gain_sign = (track_gain >> 9) & 1
+		track_gain_adjustment = (track_gain & 511) / 10.0
 
 		if track_gain_sign:
 			track_gain_adjustment *= -1
 
-		album_gain_type_, album_gain_origin_, album_gain_sign, album_gain_adjustment_ = bitstruct.unpack(
-			'u3 u3 b1 u9',
-			data.read(2)
-		)
+		album_gain = int.from_bytes(data.read(2), byteorder='big')
 
-		album_gain_type = LAMEReplayGainType(album_gain_type_)
-		album_gain_origin = LAMEReplayGainOrigin(album_gain_origin_)
-		album_gain_adjustment = album_gain_adjustment_ / 10.0
+		album_gain_type = LAMEReplayGainType((album_gain >> 13) & 7)
+		album_gain_origin = LAMEReplayGainOrigin((album_gain >> 10) & 7)
+		album_gain_sign = (album_gain >> 9) & 1
+		album_gain_adjustment = (album_gain & 511) / 10.0
 
 		if album_gain_sign:
 			album_gain_adjustment *= -1
@@ -134,7 +174,7 @@ class LAMEHeader(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if k == 'bitrate':
 				repr_dict[k] = humanize_bitrate(v)
 			elif k == 'audio_size':
@@ -151,84 +191,56 @@ class LAMEHeader(DictMixin):
 		if not encoder.startswith(b'LAME'):
 			raise InvalidHeader('Valid LAME header not found.')
 
-		version_match = re.search(rb'LAME(\d+)\.(\d+)', encoder)
+		version_match = _lame_version_re.match(encoder)
 		if version_match:
 			version = tuple(int(part) for part in version_match.groups())
 		else:
 			version = None
 
-		revision, bitrate_mode_ = bitstruct.unpack(
-			'u4 u4',
-			data.read(1)
-		)
-		bitrate_mode = LAMEBitrateMode(bitrate_mode_)
+		revision_bitrate_mode = _U8.unpack(data.read(1))[0]
+		revision = revision_bitrate_mode >> 4
+		bitrate_mode = LAMEBitrateMode(revision_bitrate_mode & 15)
 
 		# TODO: Decide what, if anything, to do with the different meanings in LAME.
 		# quality = (100 - xing_quality) % 10
 		# vbr_quality = (100 - xing_quality) // 10
 
-		lowpass_filter = struct.unpack(
-			'B',
-			data.read(1)
-		)[0] * 100
+		lowpass_filter = _U8.unpack(data.read(1))[0] * 100
 
 		replay_gain = LAMEReplayGain.load(data)
 
-		flags_ath = bitstruct.unpack_dict(
-			'b1 b1 b1 b1 u4',
-			[
-				'nogap_continuation',
-				'nogap_continued',
-				'nssafejoint',
-				'nspsytune',
-				'ath_type'
-			],
-			data.read(1)
-		)
+		flags_ath = _U8.unpack(data.read(1))[0]
 
-		ath_type = flags_ath.pop('ath_type')
+		ath_type = flags_ath & 15
 		encoding_flags = LAMEEncodingFlags(
-			flags_ath['nogap_continuation'],
-			flags_ath['nogap_continued'],
-			flags_ath['nssafejoint'],
-			flags_ath['nspsytune']
+			(flags_ath >> 7) & 1,
+			(flags_ath >> 6) & 1,
+			(flags_ath >> 5) & 1,
+			(flags_ath >> 4) & 1
 		)
 
 		# TODO: Different representation for VBR minimum bitrate vs CBR/ABR specified bitrate?
 		# Can only go up to 255.
-		bitrate = struct.unpack(
-			'B',
-			data.read(1)
-		)[0] * 1000
-
-		delay, padding = bitstruct.unpack(
-			'u12 u12',
-			data.read(3)
-		)
+		bitrate = _U8.unpack(data.read(1))[0] * 1000
 
-		source_sample_rate, unwise_settings_used, channel_mode_, noise_shaping = bitstruct.unpack(
-			'u2 u1 u3 u2',
-			data.read(1)
-		)
-		channel_mode = LAMEChannelMode(channel_mode_)
+		delay_padding = int.from_bytes(data.read(3), byteorder='big')
+		delay = delay_padding >> 12
+		padding = delay_padding & 4095
 
-		mp3_gain = bitstruct.unpack(
-			's8',
-			data.read(1)
-		)[0]
+		misc = _U8.unpack(data.read(1))[0]
+		source_sample_rate = misc >> 6
+		unwise_settings_used = (misc >> 5) & 1
+		channel_mode = LAMEChannelMode((misc >> 2) & 7)
+		noise_shaping = misc & 3
 
-		surround_info_, preset_used_ = bitstruct.unpack(
-			'p2 u3 u11',
-			data.read(2)
-		)
-		surround_info = LAMESurroundInfo(surround_info_)
+		mp3_gain = _I8.unpack(data.read(1))[0]
 
-		preset = LAMEPreset(preset_used_)
+		surround_info_preset = _U16BE.unpack(data.read(2))[0]
+		surround_info = LAMESurroundInfo((surround_info_preset >> 11) & 7)
 
-		audio_size, audio_crc, lame_crc = struct.unpack(
-			'>I2s2s',
-			data.read(8)
-		)
+		preset = LAMEPreset(surround_info_preset & 2047)
+
+		audio_size, audio_crc, lame_crc = _LAME_TAIL.unpack(data.read(8))
 
 		return cls(
 			lame_crc,
@@ -272,24 +284,26 @@ class XingHeader(DictMixin):
 		if data.read(4) not in [b'Xing', b'Info']:
 			raise InvalidHeader('Valid Xing header not found.')
 
-		flags = struct.unpack('>i', data.read(4))[0]
+		flags = _I32BE.unpack(data.read(4))[0]
 
-		num_frames = num_bytes = toc = quality = lame_header = None
+		num_frames = num_bytes = toc = quality = None
 
 		if flags & 1:
-			num_frames = struct.unpack('>I', data.read(4))[0]
+			num_frames = _U32BE.unpack(data.read(4))[0]
 
 		if flags & 2:
-			num_bytes = struct.unpack('>I', data.read(4))[0]
+			num_bytes = _U32BE.unpack(data.read(4))[0]
 
 		if flags & 4:
 			toc = XingToC(bytearray(data.read(100)))
 
 		if flags & 8:
-			quality = struct.unpack('>I', data.read(4))[0]
+			quality = _U32BE.unpack(data.read(4))[0]
 
-		if data.peek(4) == b'LAME':
+		try:
 			lame_header = LAMEHeader.load(data, quality)
+		except InvalidHeader:
+			lame_header = None
 
 		return cls(lame_header, num_frames, num_bytes, toc, quality)
 
@@ -317,15 +331,17 @@ class VBRIHeader(DictMixin):
 		if data.read(4) not in [b'VBRI']:
 			raise InvalidHeader('Valid VBRI header not found.')
 
-		version = struct.unpack('>H', data.read(2))[0]
-		delay = struct.unpack('>e', data.read(2))[0]
-		quality = struct.unpack('>H', data.read(2))[0]
-		num_bytes = struct.unpack('>I', data.read(4))[0]
-		num_frames = struct.unpack('>I', data.read(4))[0]
-		num_toc_entries = struct.unpack('>H', data.read(2))[0]
-		toc_scale_factor = struct.unpack('>H', data.read(2))[0]
-		toc_entry_num_bytes = struct.unpack('>H', data.read(2))[0]
-		toc_entry_num_frames = struct.unpack('>H', data.read(2))[0]
+		(
+			version,
+			delay,
+			quality,
+			num_bytes,
+			num_frames,
+			num_toc_entries,
+			toc_scale_factor,
+			toc_entry_num_bytes,
+			toc_entry_num_frames
+		) = _VBRI_HEADER.unpack(data.read(_VBRI_HEADER.size))
 
 		toc_size = num_toc_entries * toc_entry_num_bytes
 
@@ -333,14 +349,11 @@ class VBRIHeader(DictMixin):
 			raise InvalidHeader('Invalid VBRI TOC entry size.')
 
 		if toc_entry_num_bytes == 2:
-			pattern = '>H'
+			toc_pattern = f'>{num_toc_entries}H'
 		else:
-			pattern = '>I'
+			toc_pattern = f'>{num_toc_entries}I'
 
-		toc = VBRIToC(
-			struct.unpack(pattern, data.read(toc_entry_num_bytes))[0]
-			for _ in range(toc_size // toc_entry_num_bytes)
-		)
+		toc = VBRIToC(struct.unpack(toc_pattern, data.read(toc_size)))
 
 		return cls(
 			version,
@@ -374,7 +387,7 @@ class MPEGFrameHeader(DictMixin):
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k, v in self.items():
 			if k == 'bitrate':
 				repr_dict[k] = humanize_bitrate(v)
 			elif k == 'sample_rate':
@@ -389,41 +402,32 @@ class MPEGFrameHeader(DictMixin):
 	def load(cls, data):
 		frame_start = data.tell()
 
-		sync, version_id, layer_index, protection = bitstruct.unpack(
-			'u11 u2 u2 b1',
-			data.read(2)
-		)
+		frame_header = int.from_bytes(data.read(4), byteorder='big')
 
-		if sync != 2047:
+		if not _is_valid_frame_header(frame_header):
 			raise InvalidFrame('Not a valid MPEG audio frame.')
 
-		version = [2.5, None, 2, 1][version_id]
+		version_id = (frame_header >> 19) & 3
+		layer_index = (frame_header >> 17) & 3
+		protection = (frame_header >> 16) & 1
+		bitrate_index = (frame_header >> 12) & 15
+		sample_rate_index = (frame_header >> 10) & 3
+		padded = (frame_header >> 9) & 1
+		channel_mode_ = (frame_header >> 6) & 3
+
+		version = _MPEG_VERSIONS[version_id]
 
 		layer = 4 - layer_index
 
 		protected = not protection
 
-		bitrate_index, sample_rate_index, padded = bitstruct.unpack(
-			'u4 u2 u1',
-			data.read(1)
-		)
-
-		if (
-			version_id == 1
-			or layer_index == 0
-			or bitrate_index == 0
-			or bitrate_index == 15
-			or sample_rate_index == 3
-		):
-			raise InvalidFrame('Not a valid MPEG audio frame.')
-
-		channel_mode = MP3ChannelMode(bitstruct.unpack('u2', data.read(1))[0])
+		channel_mode = MP3ChannelMode(channel_mode_)
 		channels = 1 if channel_mode == 3 else 2
 
-		bitrate = MP3Bitrates[(version, layer)][bitrate_index] * 1000
-		sample_rate = MP3SampleRates[version][sample_rate_index]
+		bitrate = _MPEG_BITRATES[version_id][layer_index][bitrate_index] * 1000
+		sample_rate = _MPEG_SAMPLE_RATES[version_id][sample_rate_index]
 
-		samples_per_frame, slot_size = MP3SamplesPerFrame[(version, layer)]
+		samples_per_frame, slot_size = _MPEG_SAMPLES_PER_FRAME[version_id][layer_index]
 
 		frame_size = (((samples_per_frame // 8 * bitrate) // sample_rate) + padded) * slot_size
 
@@ -440,14 +444,16 @@ class MPEGFrameHeader(DictMixin):
 			else:
 				xing_header_start = 13
 
-			data.seek(frame_start + xing_header_start, os.SEEK_SET)
+			# Read through the VBRI position, the furthest possible tag,
+			# once to probe for both Xing and VBRI headers.
+			frame_probe = data.read(36)
 
-			if data.peek(4) in [b'Xing', b'Info']:
+			if frame_probe[xing_header_start - 4:xing_header_start] in [b'Xing', b'Info']:
+				data.seek(frame_start + xing_header_start, os.SEEK_SET)
 				xing_header = XingHeader.load(data.read(frame_size))
 
-			data.seek(frame_start + 36, os.SEEK_SET)
-
-			if data.peek(4) == b'VBRI':
+			if frame_probe[32:36] == b'VBRI':
+				data.seek(frame_start + 36, os.SEEK_SET)
 				vbri_header = VBRIHeader.load(data)
 
 		return cls(
@@ -487,50 +493,119 @@ class MP3StreamInfo(StreamInfo):
 	def find_mp3_frames(data):
 		frames = []
 		cached_frames = None
-		buffer_size = 128
-		buffer = data.peek(buffer_size)
+		buffer_size = 64 * 1024
+		buffer_start = data.tell()
+		buffer = data.read(buffer_size)
+		cursor = 0
+
+		while True:
+			match = _mpeg_sync_re.search(buffer, cursor)
+
+			if match is None:
+				if len(buffer) < buffer_size:
+					break
 
-		while len(buffer) >= buffer_size:
-			sync_start = buffer.find(b'\xFF')
+				# Overlap windows by a byte so a sync split across them isn't missed.
+				buffer_start += max(len(buffer) - 1, cursor)
+				data.seek(buffer_start, os.SEEK_SET)
+				buffer = data.read(buffer_size)
+				cursor = 0
 
-			if sync_start == -1:
-				data.seek(buffer_size, os.SEEK_CUR)
-				buffer = data.peek(buffer_size)
 				continue
-			else:
-				data.seek(sync_start, os.SEEK_CUR)
-
-			if bitstruct.unpack('u11', data.peek(2))[0] == 2047:
-				for _ in range(4):
-					try:
-						frame = MPEGFrameHeader.load(data)
-						frames.append(frame)
-						if frame._xing:
-							break
-						data.seek(frame._start + frame._size, os.SEEK_SET)
-					except (InvalidFrame, bitstruct.Error):
-						data.seek(1, os.SEEK_CUR)
-						break
-			else:
-				data.seek(sync_start + 1, os.SEEK_CUR)
+
+			sync_start = match.start()
+			cursor = sync_start + 1
+
+			# Reject false syncs from the buffer before touching the stream.
+			if (
+				len(buffer) - sync_start >= 4
+				and not _is_valid_frame_header(
+					int.from_bytes(buffer[sync_start:sync_start + 4], byteorder='big')
+				)
+			):
+				continue
+
+			data.seek(buffer_start + sync_start, os.SEEK_SET)
+
+			for _ in range(4):
+				try:
+					frame = MPEGFrameHeader.load(data)
+				except InvalidFrame:
+					break
+
+				frames.append(frame)
+				if frame._xing:
+					break
+
+				data.seek(frame._start + frame._size, os.SEEK_SET)
 
 			if frames and (len(frames) >= 4 or frames[0]._xing):
-				break
+				return frames
+
+			if frames:
+				# Resume after the frames just walked rather than
+				# retrying syncs inside them.
+				cursor = frames[-1]._start + frames[-1]._size - buffer_start
 
 			if len(frames) >= 2 and cached_frames is None:
 				cached_frames = frames.copy()
 
 			del frames[:]
 
-			buffer = data.peek(buffer_size)
+		if not cached_frames:
+			raise InvalidFormat("Missing XING header and insufficient MPEG frames.")
+
+		return cached_frames
 
-		if not frames:
-			if not cached_frames:
-				raise InvalidFormat("Missing XING header and insufficient MPEG frames.")
+	@staticmethod
+	def _find_audio_end(data, audio_start):
+		data.seek(0, os.SEEK_END)
+		audio_end = data.tell()
+
+		# ID3v1 is always the last 128 bytes.
+		if audio_end - audio_start >= 128:
+			data.seek(-128, os.SEEK_END)
+
+			if data.read(3) == b'TAG':
+				audio_end -= 128
+
+		# APEv2 and Lyrics3 tags can precede ID3v1 in either order.
+		# Walk back through them using the size given by each tag's footer.
+		while audio_end - audio_start >= 32:
+			data.seek(audio_end - 32, os.SEEK_SET)
+			footer = data.read(32)
+
+			if footer.startswith(b'APETAGEX'):
+				tag_size = int.from_bytes(footer[12:16], byteorder='little')
+
+				# Footer size includes the footer itself, so anything smaller is corrupt.
+				if tag_size < 32:
+					break
+
+				# Footer size doesn't include the header, if present.
+				if int.from_bytes(footer[20:24], byteorder='little') & 0x80000000:
+					tag_size += 32
+			elif footer.endswith(b'LYRICS200') and footer[-15:-9].isdigit():
+				tag_size = int(footer[-15:-9]) + 15
+			elif footer.endswith(b'LYRICSEND'):
+				# Lyrics3v1 has no size field but is limited to 5100 bytes of lyrics.
+				search_size = min(audio_end - audio_start, 5120)
+				data.seek(audio_end - search_size, os.SEEK_SET)
+				lyrics_start = data.read(search_size).rfind(b'LYRICSBEGIN')
+
+				if lyrics_start == -1:
+					break
+
+				tag_size = search_size - lyrics_start
 			else:
-				frames = cached_frames
+				break
+
+			if tag_size > audio_end - audio_start:
+				break
+
+			audio_end -= tag_size
 
-		return frames
+		return audio_end
 
 	@datareader
 	@classmethod
@@ -539,31 +614,8 @@ class MP3StreamInfo(StreamInfo):
 
 		samples_per_frame, _ = MP3SamplesPerFrame[(frames[0].version, frames[0].layer)]
 
-		data.seek(0, os.SEEK_END)
-		end_pos = data.tell()
-
-		# This is an arbitrary amount that should hopefully encompass all end tags.
-		# Starting low so as not to add unnecessary processing time.
-		chunk_size = 64 * 1024
-		if end_pos > chunk_size:
-			data.seek(-chunk_size, os.SEEK_END)
-		else:
-			data.seek(0, os.SEEK_SET)
-
-		end_buffer = data.read()
-
-		end_tag_offset = 0
-		for tag_type in [b'APETAGEX', b'LYRICSBEGIN', b'TAG']:
-			tag_offset = end_buffer.rfind(tag_type)
-
-			if tag_offset > 0:
-				tag_offset = len(end_buffer) - tag_offset
-
-				if tag_offset > end_tag_offset:
-					end_tag_offset = tag_offset
-
 		audio_start = frames[0]._start
-		audio_end = end_pos - end_tag_offset
+		audio_end = cls._find_audio_end(data, audio_start)
 		audio_size = audio_end - audio_start
 
 		bitrate_mode = MP3BitrateMode.UNKNOWN
@@ -595,7 +647,7 @@ class MP3StreamInfo(StreamInfo):
 			num_samples = samples_per_frame * vbri_header.num_frames
 			bitrate_mode = MP3BitrateMode.VBR
 		else:
-			if more_itertools.all_equal([frame['bitrate'] for frame in frames]):
+			if len({frame.bitrate for frame in frames}) == 1:
 				bitrate_mode = MP3BitrateMode.CBR
 
 			num_samples = samples_per_frame * (audio_size / frames[0]._size)
@@ -668,16 +720,39 @@ class MP3(Format):
 
 			end_buffer = self._obj.read()
 
-			apev2_index = end_buffer.find(b'APETAGEX')
-			if apev2_index != -1:
-				end_buffer = end_buffer[apev2_index + 8:]
-
-			id3v1_index = end_buffer.find(b'TAG')
-			if id3v1_index != -1:
-				id3v1 = ID3v1.load(end_buffer[id3v1_index : id3v1_index + 128])
+			# ID3v1 is always the last 128 bytes, after any APEv2/Lyrics3 tags.
+			if len(end_buffer) >= 128 and end_buffer[-128:-125] == b'TAG':
+				id3v1 = ID3v1.load(end_buffer[-128:])
 				self._id3 = id3v1
 				self.tags = self._id3.tags
 
 		self._obj.close()
 
 		return self
+
+	@classmethod
+	def load_many(cls, filepaths, workers=None):
+		"""Load multiple MP3 files in parallel worker processes.
+
+		Parameters:
+			filepaths (iterable): Filepaths or path-like objects of MP3 files.
+			workers (int, Optional): Maximum number of worker processes.
+				Default: Number of processors on the machine.
+
+		Returns:
+			list: :class:`MP3` objects in the same order as ``filepaths``.
+				Unlike :meth:`load`, their ``_obj`` is ``None``,
+				as file objects can't be sent back from worker processes.
+		"""
+
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			return list(executor.map(partial(_load_for_worker, cls), filepaths))
+
+
+def _load_for_worker(cls, filepath):
+	self = cls.load(filepath)
+
+	# File objects can't be sent back from a worker process.
+	self._obj = None
+
+	return self
@@ -28,6 +28,7 @@ class RIFFTags(Tags):
 			'tracknumber': 'ITRK'
 		}
 	)
+	_FIELD_MAP_INV = dict(FIELD_MAP.inv)
 
 	@datareader
 	@classmethod
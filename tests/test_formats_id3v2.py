@@ -0,0 +1,80 @@
+import struct
+from io import BytesIO
+
+import pytest
+from audio_metadata import (
+	ID3v2,
+	ID3v2Frame,
+	ID3v22Frames,
+	ID3v24Frames,
+	ID3v2Frames,
+	ID3Version
+)
+from audio_metadata.utils import DataReader
+from bidict import frozenbidict
+
+AUDIO = b'\xff\xfb\x90\x00' + b'\x00' * 100
+TIT2_FRAME = b'TIT2\x00\x00\x00\x05\x00\x00\x03test'
+
+
+@pytest.mark.parametrize(
+	'version,extended_header',
+	[
+		(3, b'\x00\x00\x00\x06' b'\x00\x00' b'\x00\x00\x00\x00'),
+		(4, b'\x00\x00\x00\x06' b'\x01' b'\x00'),
+	]
+)
+def test_ID3v2_extended_header(version, extended_header):
+	body = extended_header + TIT2_FRAME + b'\x00' * 10
+	data = DataReader(
+		b'ID3'
+		+ bytes([version, 0])
+		+ b'\x40'
+		+ len(body).to_bytes(4, byteorder='big')
+		+ body
+		+ AUDIO
+	)
+	id3v2 = ID3v2.load(data)
+
+	assert id3v2._header.flags.extended
+	assert id3v2._size == 10 + len(body)
+	assert data.tell() == id3v2._size
+	assert id3v2.tags['title'] == ['test']
+
+
+def test_ID3v2_footer():
+	body = TIT2_FRAME + b'\x00' * 10
+	header = b'\x04\x00\x10' + len(body).to_bytes(4, byteorder='big')
+	data = DataReader(b'ID3' + header + body + b'3DI' + header + AUDIO)
+	id3v2 = ID3v2.load(data)
+
+	assert id3v2._header.flags.footer
+	assert id3v2._size == 20 + len(body)
+	assert data.tell() == id3v2._size
+	assert id3v2.tags['title'] == ['test']
+
+
+def test_ID3v2Frames_field_maps():
+	v22_frames = ID3v2Frames.load(b'TT2\x00\x00\x05\x00test', ID3Version.v22)
+	v24_frames = ID3v2Frames.load(TIT2_FRAME, ID3Version.v24)
+
+	assert type(v22_frames) is ID3v22Frames
+	assert type(v24_frames) is ID3v24Frames
+	assert v22_frames['title'] == v24_frames['title'] == ['test']
+	assert list(v22_frames) == list(v24_frames) == ['title']
+	assert ID3v2Frames.FIELD_MAP == ID3v2Frames().FIELD_MAP == frozenbidict()
+
+
+def test_ID3v2Frames_bytes_only():
+	assert ID3v2Frames.load(memoryview(TIT2_FRAME), ID3Version.v24)['title'] == ['test']
+
+	with pytest.raises(ValueError):
+		ID3v2Frames.load(BytesIO(TIT2_FRAME), ID3Version.v24)
+
+
+def test_ID3v2Frame_offset():
+	frame, offset = ID3v2Frame.load(b'\x00' * 3 + TIT2_FRAME, 3, struct.Struct('4s4B2B'), 4, 7)
+
+	assert frame.id == 'TIT2'
+	assert frame.value == ['test']
+	assert offset == 3 + len(TIT2_FRAME)
@@ -59,9 +59,13 @@ def test_StreamInfo():
 	assert strip_repr(stream_info) == "<StreamInfo ({'bitrate': '320 Kbps', 'channels': 2, 'duration': '01:40', 'sample_rate': '44.1 KHz',})>"
 
 
+class FieldMapTags(Tags):
+	FIELD_MAP = frozenbidict({'artist': 'key1', 'title': 'key2'})
+	_FIELD_MAP_INV = dict(FIELD_MAP.inv)
+
+
 def test_Tags():
-	test_tags = Tags(key1='value1', key2='value2')
-	test_tags.FIELD_MAP = frozenbidict({'artist': 'key1', 'title': 'key2'})
+	test_tags = FieldMapTags(key1='value1', key2='value2')
 
 	assert test_tags['artist'] == test_tags['key1']
 	assert test_tags['title'] == test_tags['key2']
@@ -71,5 +75,13 @@ def test_Tags():
 	assert 'key3' not in test_tags
 
 	assert list(iter(test_tags)) == ['artist', 'title']
+	assert len(test_tags) == 2
+	assert list(test_tags.items()) == [('key1', 'value1'), ('key2', 'value2')]
+	assert Tags.FIELD_MAP == frozenbidict()
+
+	assert repr(test_tags) == "<FieldMapTags ({'artist': 'value1', 'title': 'value2'})>"
+
+	test_tags.update({'FIELD_MAP': {}})
 
-	assert repr(test_tags) == "<Tags ({'artist': 'value1', 'title': 'value2'})>"
+	assert test_tags['artist'] == 'value1'
+	assert list(iter(test_tags)) == ['artist', 'title', 'FIELD_MAP']
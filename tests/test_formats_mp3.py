@@ -1,11 +1,108 @@
+from io import BytesIO
+from pathlib import Path
+
 import pytest
 from audio_metadata import (
+	MP3,
 	InvalidHeader,
 	LAMEReplayGain,
+	MP3BitrateMode,
+	MP3StreamInfo,
+	VBRIHeader,
+	VBRIToC,
 	XingHeader,
 	XingToC
 )
 
+test_filepaths = sorted((Path(__file__).parent / 'files' / 'audio').glob('*.mp3'))
+
+id3v1_tag = b'TAG' + b'\x00' * 125
+
+
+def apev2_tag(items=b'\x00' * 16, header=True):
+	size = (len(items) + 32).to_bytes(4, byteorder='little')
+	flags = (0xA0000000 if header else 0).to_bytes(4, byteorder='little')
+	footer = b'APETAGEX' + b'\xd0\x07\x00\x00' + size + b'\x01\x00\x00\x00' + flags + b'\x00' * 8
+
+	if header:
+		return b'APETAGEX' + footer[8:] + items + footer
+
+	return items + footer
+
+
+def lyrics3v2_tag(lyrics=b'LYR00005hello'):
+	return b'LYRICSBEGIN' + lyrics + str(len(lyrics) + 11).zfill(6).encode() + b'LYRICS200'
+
+
+def lyrics3v1_tag(lyrics=b'hello'):
+	return b'LYRICSBEGIN' + lyrics + b'LYRICSEND'
+
+
+@pytest.mark.integration
+def test_MP3_load_many():
+	mp3s = MP3.load_many(test_filepaths, workers=2)
+
+	assert len(mp3s) == len(test_filepaths)
+
+	for filepath, mp3 in zip(test_filepaths, mp3s):
+		expected = MP3.load(filepath)
+
+		assert mp3.filepath == expected.filepath
+		assert mp3.streaminfo == expected.streaminfo
+		assert mp3.tags == expected.tags
+		assert mp3.keys() == expected.keys()
+		assert mp3._obj is None
+
+
+@pytest.mark.parametrize(
+	'tags',
+	[
+		b'',
+		id3v1_tag,
+		apev2_tag(),
+		apev2_tag(header=False),
+		lyrics3v2_tag(),
+		lyrics3v1_tag(),
+		apev2_tag() + id3v1_tag,
+		lyrics3v2_tag() + apev2_tag() + id3v1_tag,
+		apev2_tag() + lyrics3v2_tag() + id3v1_tag,
+		lyrics3v1_tag() + id3v1_tag,
+	]
+)
+def test_MP3StreamInfo_find_audio_end(tags):
+	audio = b'\xff\xfb\x90\x00' + b'\x00' * 1000
+
+	assert MP3StreamInfo._find_audio_end(BytesIO(audio + tags), 0) == len(audio)
+
+
+def test_MP3StreamInfo_find_audio_end_invalid_size():
+	audio = b'\xff\xfb\x90\x00' + b'\x00' * 1000
+
+	for size in [0, 16]:
+		footer = b'APETAGEX' + b'\xd0\x07\x00\x00' + size.to_bytes(4, byteorder='little') + b'\x00' * 16
+
+		assert MP3StreamInfo._find_audio_end(BytesIO(audio + footer), 0) == len(audio) + 32
+		assert MP3StreamInfo._find_audio_end(BytesIO(audio + footer + id3v1_tag), 0) == len(audio) + 32
+
+	# Larger than the audio.
+	footer = b'APETAGEX' + b'\xd0\x07\x00\x00' + (2048).to_bytes(4, byteorder='little') + b'\x00' * 16
+	assert MP3StreamInfo._find_audio_end(BytesIO(audio + footer), 0) == len(audio) + 32
+
+
+@pytest.mark.integration
+def test_MP3StreamInfo_sync_branch():
+	mp3 = MP3.load(Path(__file__).parent / 'files' / 'audio' / 'test-mp3-sync-branch.mp3')
+
+	assert mp3.streaminfo._start == 6
+	assert mp3.streaminfo.bitrate_mode is MP3BitrateMode.VBR
+
+
+@pytest.mark.integration
+def test_MP3StreamInfo_apev2_size():
+	mp3 = MP3.load(Path(__file__).parent / 'files' / 'audio' / 'test-mp3-apev2.mp3')
+
+	assert mp3.streaminfo._size == 202709
+
 
 def test_LAMEReplayGain():
 	replay_gain_load = LAMEReplayGain.load(b'\x00\x1b\xfa\x05,D\x00\x00')
@@ -102,3 +199,53 @@ def test_XingHeader_no_lame():
 	assert xing_header_load.num_frames == xing_header_init.num_frames == 193
 	assert xing_header_load.quality == xing_header_init.quality == 100
 	assert xing_header_load.toc == xing_header_init.toc == XingToC(bytearray(xing_data[16:116]))
+
+
+def test_VBRIHeader():
+	vbri_data = (
+		b'VBRI'
+		b'\x00\x01'
+		b'\x00\x00'
+		b'\x00K'
+		b'\x00\x00Pr'
+		b'\x00\x00\x00\xc2'
+		b'\x00\x03'
+		b'\x00\x01'
+		b'\x00\x02'
+		b'\x00\x01'
+		b'\x00\x10\x00\x20\x01\x00'
+	)
+
+	with pytest.raises(InvalidHeader):
+		VBRIHeader.load(vbri_data[4:])
+
+	vbri_header_load = VBRIHeader.load(vbri_data)
+	vbri_header_init = VBRIHeader(
+		version=1,
+		delay=0.0,
+		quality=75,
+		num_bytes=20594,
+		num_frames=194,
+		num_toc_entries=3,
+		toc_scale_factor=1,
+		toc_entry_num_bytes=2,
+		toc_entry_num_frames=1,
+		toc=VBRIToC([16, 32, 256])
+	)
+
+	assert vbri_header_load == vbri_header_init
+	assert vbri_header_load.num_toc_entries == len(vbri_header_load.toc) == 3
+	assert vbri_header_load.toc == vbri_header_init.toc == VBRIToC([16, 32, 256])
+
+	vbri_header_load = VBRIHeader.load(
+		vbri_data[:22]
+		+ b'\x00\x04'
+		+ vbri_data[24:26]
+		+ b'\x00\x00\x00\x10\x00\x00\x00\x20\x00\x01\x00\x00'
+	)
+
+	assert vbri_header_load.toc_entry_num_bytes == 4
+	assert vbri_header_load.toc == VBRIToC([16, 32, 65536])
+
+	with pytest.raises(InvalidHeader):
+		VBRIHeader.load(vbri_data[:22] + b'\x00\x03' + vbri_data[24:])